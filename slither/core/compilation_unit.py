@@ -125,9 +125,9 @@ class SlitherCompilationUnit(Context):
     @property
     def contracts_derived(self) -> List[Contract]:
         """list(Contract): List of contracts that are derived and not inherited."""
-        inheritances = [x.inheritance for x in self.contracts]
-        inheritance = [item for sublist in inheritances for item in sublist]
-        return [c for c in self.contracts if c not in inheritance and not c.is_top_level]
+        # Set of every contract inherited by another one, looked up once per contract
+        inherited = {father for x in self.contracts for father in x.inheritance}
+        return [c for c in self.contracts if c not in inherited and not c.is_top_level]
 
     def get_contract_from_name(self, contract_name: Union[str, Constant]) -> List[Contract]:
         """
@@ -88,6 +88,8 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
 
         self._signatures: Optional[List[str]] = None
         self._signatures_declared: Optional[List[str]] = None
+        self._is_possible_token: Optional[bool] = None
+        self._ercs: Optional[List[str]] = None
 
         self._is_upgradeable: Optional[bool] = None
         self._is_upgradeable_proxy: Optional[bool] = None
@@ -336,7 +338,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
 
         list(StateVariable): List of the state variables. Alias to self.state_variables.
         """
-        return list(self.state_variables)
+        return self.state_variables
 
     @property
     def variables_as_dict(self) -> Dict[str, "StateVariable"]:
@@ -683,6 +685,13 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         """
         return list(reversed(self._inheritance))
 
+    def inherits_from(self, other) -> bool:
+        """
+        Return true if other is in the inheritance list
+        Unlike `other in self.inheritance`, it does not copy the list
+        """
+        return other in self._inheritance
+
     def set_inheritance(
         self,
         inheritance: List["Contract"],
@@ -699,7 +708,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         list(Contract): Return the list of contracts derived from self
         """
         candidates = self.compilation_unit.contracts
-        return [c for c in candidates if self in c.inheritance]
+        return [c for c in candidates if c.inherits_from(self)]
 
     # endregion
     ###################################################################################
@@ -730,10 +739,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         Returns:
             Function
         """
-        return next(
-            (f for f in self.functions if f.full_name == full_name and not f.is_shadowed),
-            None,
-        )
+        return self.available_functions_as_dict().get(full_name)
 
     def get_function_from_signature(self, function_signature: str) -> Optional["Function"]:
         """
@@ -789,7 +795,8 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
 
         :param variable_name:
         """
-        return next((v for v in self.state_variables if v.name == variable_name), None)
+        # The variables are indexed by name, no need to scan them
+        return self._variables.get(variable_name)
 
     def get_state_variable_from_canonical_name(
         self, canonical_name: str
@@ -995,6 +1002,8 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         Return the ERC implemented
         :return: list of string
         """
+        if self._ercs is not None:
+            return self._ercs
         all_erc = [
             ("ERC20", self.is_erc20),
             ("ERC165", self.is_erc165),
@@ -1007,7 +1016,8 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
             ("ERC4626", self.is_erc4626),
         ]
 
-        return [erc for erc, is_erc in all_erc if is_erc()]
+        self._ercs = [erc for erc, is_erc in all_erc if is_erc()]
+        return self._ercs
 
     def is_erc20(self) -> bool:
         """
@@ -1171,7 +1181,9 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         Check if the contract is a potential token (it might not implement all the functions)
         :return:
         """
-        return self.is_possible_erc20() or self.is_possible_erc721()
+        if self._is_possible_token is None:
+            self._is_possible_token = self.is_possible_erc20() or self.is_possible_erc721()
+        return self._is_possible_token
 
     # endregion
     ###################################################################################
@@ -1235,10 +1247,10 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
                 return False
             initializable = self.file_scope.get_contract_from_name("Initializable")
             if initializable:
-                if initializable in self.inheritance:
+                if initializable in self._inheritance:
                     self._is_upgradeable = True
             else:
-                for contract in self.inheritance + [self]:
+                for contract in self._inheritance + [self]:
                     # This might lead to false positive
                     # Not sure why pylint is having a trouble here
                     # pylint: disable=no-member
@@ -1255,29 +1267,27 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
     def is_upgradeable(self, upgradeable: bool):
         self._is_upgradeable = upgradeable
 
-    @property
-    def is_upgradeable_proxy(self) -> bool:
+    def _fallback_delegatecalls(self) -> bool:
         from slither.core.cfg.node import NodeType
-        from slither.slithir.operations import LowLevelCall
 
-        if self._is_upgradeable_proxy is None:
-            self._is_upgradeable_proxy = False
-            if "Proxy" in self.name:
-                self._is_upgradeable_proxy = True
+        for f in self.functions:
+            if not f.is_fallback:
+                continue
+            # The low level calls are already collected per function, no need to walk the IRs
+            if any(name == "delegatecall" for _, name in f.all_low_level_calls()):
                 return True
-            for f in self.functions:
-                if f.is_fallback:
-                    for node in f.all_nodes():
-                        for ir in node.irs:
-                            if isinstance(ir, LowLevelCall) and ir.function_name == "delegatecall":
-                                self._is_upgradeable_proxy = True
-                                return self._is_upgradeable_proxy
-                        if node.type == NodeType.ASSEMBLY:
-                            inline_asm = node.inline_asm
-                            if inline_asm:
-                                if "delegatecall" in inline_asm:
-                                    self._is_upgradeable_proxy = True
-                                    return self._is_upgradeable_proxy
+            for node in f.all_nodes():
+                if node.type != NodeType.ASSEMBLY:
+                    continue
+                inline_asm = node.inline_asm
+                if isinstance(inline_asm, str) and "delegatecall" in inline_asm:
+                    return True
+        return False
+
+    @property
+    def is_upgradeable_proxy(self) -> bool:
+        if self._is_upgradeable_proxy is None:
+            self._is_upgradeable_proxy = "Proxy" in self.name or self._fallback_delegatecalls()
         return self._is_upgradeable_proxy
 
     @is_upgradeable_proxy.setter
@@ -1314,8 +1324,9 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
     def add_constructor_variables(self):
         from slither.core.declarations.function_contract import FunctionContract
 
-        if self.state_variables:
-            for (idx, variable_candidate) in enumerate(self.state_variables):
+        state_variables = self.state_variables
+        if state_variables:
+            for (idx, variable_candidate) in enumerate(state_variables):
                 if variable_candidate.expression and not variable_candidate.is_constant:
 
                     constructor_variable = FunctionContract(self.compilation_unit)
@@ -1333,7 +1344,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
                     )
                     variable_candidate.node_initialization = prev_node
                     counter = 1
-                    for v in self.state_variables[idx + 1 :]:
+                    for v in state_variables[idx + 1 :]:
                         if v.expression and not v.is_constant:
                             next_node = self._create_node(
                                 constructor_variable, counter, v, prev_node.scope
@@ -1345,7 +1356,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
                             counter += 1
                     break
 
-            for (idx, variable_candidate) in enumerate(self.state_variables):
+            for (idx, variable_candidate) in enumerate(state_variables):
                 if variable_candidate.expression and variable_candidate.is_constant:
 
                     constructor_variable = FunctionContract(self.compilation_unit)
@@ -1365,7 +1376,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
                     )
                     variable_candidate.node_initialization = prev_node
                     counter = 1
-                    for v in self.state_variables[idx + 1 :]:
+                    for v in state_variables[idx + 1 :]:
                         if v.expression and v.is_constant:
                             next_node = self._create_node(
                                 constructor_variable, counter, v, prev_node.scope
@@ -5,7 +5,6 @@ import logging
 from abc import abstractmethod, ABCMeta
 from collections import namedtuple
 from enum import Enum
-from itertools import groupby
 from typing import Dict, TYPE_CHECKING, List, Optional, Set, Union, Callable, Tuple
 
 from slither.core.cfg.scope import Scope
@@ -105,6 +104,18 @@ def _filter_state_variables_written(expressions: List["Expression"]):
     return ret
 
 
+def _filter_duplicates_by_str(values: List) -> List:
+    """
+    Remove the values that share the same string representation, keeping the first one
+    The result is sorted by string representation
+    Each value is converted to str only once, as str on an expression walks its whole tree
+    """
+    unique = {}
+    for value in values:
+        unique.setdefault(str(value), value)
+    return [unique[key] for key in sorted(unique)]
+
+
 class FunctionLanguage(Enum):
     Solidity = 0
     Yul = 1
@@ -212,6 +223,7 @@ class Function(SourceMapping, metaclass=ABCMeta):  # pylint: disable=too-many-pu
         self._signature_str: Optional[str] = None
         self._canonical_name: Optional[str] = None
         self._is_protected: Optional[bool] = None
+        self._is_reentrant: Optional[bool] = None
 
         self.compilation_unit: "SlitherCompilationUnit" = compilation_unit
 
@@ -1070,35 +1082,28 @@ class Function(SourceMapping, metaclass=ABCMeta):  # pylint: disable=too-many-pu
 
     def _explore_functions(self, f_new_values: Callable[["Function"], List]):
         values = f_new_values(self)
-        explored = [self]
-        to_explore = [
-            c for c in self.internal_calls if isinstance(c, Function) and c not in explored
-        ]
-        to_explore += [
-            c for (_, c) in self.library_calls if isinstance(c, Function) and c not in explored
-        ]
-        to_explore += [m for m in self.modifiers if m not in explored]
+        # Functions hash by identity, so a set gives O(1) membership tests,
+        # and the worklist is popped from the end instead of being sliced on every step
+        explored = {self}
+        to_explore = [c for c in self.internal_calls if isinstance(c, Function)]
+        to_explore += [c for (_, c) in self.library_calls if isinstance(c, Function)]
+        to_explore += self.modifiers
 
         while to_explore:
-            f = to_explore[0]
-            to_explore = to_explore[1:]
+            f = to_explore.pop()
             if f in explored:
                 continue
-            explored.append(f)
+            explored.add(f)
 
             values += f_new_values(f)
 
             to_explore += [
-                c
-                for c in f.internal_calls
-                if isinstance(c, Function) and c not in explored and c not in to_explore
+                c for c in f.internal_calls if isinstance(c, Function) and c not in explored
             ]
             to_explore += [
-                c
-                for (_, c) in f.library_calls
-                if isinstance(c, Function) and c not in explored and c not in to_explore
+                c for (_, c) in f.library_calls if isinstance(c, Function) and c not in explored
             ]
-            to_explore += [m for m in f.modifiers if m not in explored and m not in to_explore]
+            to_explore += [m for m in f.modifiers if m not in explored]
 
         return list(set(values))
 
@@ -1490,6 +1495,11 @@ class Function(SourceMapping, metaclass=ABCMeta):  # pylint: disable=too-many-pu
         """
         Determine if the function can be re-entered
         """
+        if self._is_reentrant is None:
+            self._is_reentrant = self._compute_is_reentrant()
+        return self._is_reentrant
+
+    def _compute_is_reentrant(self) -> bool:
         # TODO: compare with hash of known nonReentrant modifier instead of the name
         if "nonReentrant" in [m.name for m in self.modifiers]:
             return False
@@ -1519,10 +1529,7 @@ class Function(SourceMapping, metaclass=ABCMeta):  # pylint: disable=too-many-pu
         write_var = [item for sublist in write_var for item in sublist]
         write_var = list(set(write_var))
         # Remove dupplicate if they share the same string representation
-        write_var = [
-            next(obj)
-            for i, obj in groupby(sorted(write_var, key=lambda x: str(x)), lambda x: str(x))
-        ]
+        write_var = _filter_duplicates_by_str(write_var)
         self._expression_vars_written = write_var
 
         write_var = [x.variables_written for x in self.nodes]
@@ -1530,30 +1537,21 @@ class Function(SourceMapping, metaclass=ABCMeta):  # pylint: disable=too-many-pu
         write_var = [item for sublist in write_var for item in sublist]
         write_var = list(set(write_var))
         # Remove dupplicate if they share the same string representation
-        write_var = [
-            next(obj)
-            for i, obj in groupby(sorted(write_var, key=lambda x: str(x)), lambda x: str(x))
-        ]
+        write_var = _filter_duplicates_by_str(write_var)
         self._vars_written = write_var
 
         read_var = [x.variables_read_as_expression for x in self.nodes]
         read_var = [x for x in read_var if x]
         read_var = [item for sublist in read_var for item in sublist]
         # Remove dupplicate if they share the same string representation
-        read_var = [
-            next(obj)
-            for i, obj in groupby(sorted(read_var, key=lambda x: str(x)), lambda x: str(x))
-        ]
+        read_var = _filter_duplicates_by_str(read_var)
         self._expression_vars_read = read_var
 
         read_var = [x.variables_read for x in self.nodes]
         read_var = [x for x in read_var if x]
         read_var = [item for sublist in read_var for item in sublist]
         # Remove dupplicate if they share the same string representation
-        read_var = [
-            next(obj)
-            for i, obj in groupby(sorted(read_var, key=lambda x: str(x)), lambda x: str(x))
-        ]
+        read_var = _filter_duplicates_by_str(read_var)
         self._vars_read = read_var
 
         self._state_vars_written = [
@@ -1,14 +1,11 @@
 # https://solidity.readthedocs.io/en/v0.4.24/units-and-global-variables.html
-from typing import List, Dict, Union, TYPE_CHECKING
+from typing import List, Dict, Union
 
 from slither.core.declarations.custom_error import CustomError
 from slither.core.solidity_types import ElementaryType, TypeInformation
 from slither.core.source_mapping.source_mapping import SourceMapping
 from slither.exceptions import SlitherException
 
-if TYPE_CHECKING:
-    pass
-
 SOLIDITY_VARIABLES = {
     "now": "uint256",
     "this": "address",
@@ -197,6 +194,12 @@ class SolidityFunction(SourceMapping):
         return hash(self.name)
 
 
+destroy_functions = [
+    SolidityFunction("suicide(address)"),
+    SolidityFunction("selfdestruct(address)"),
+]
+
+
 class SolidityCustomRevert(SolidityFunction):
     def __init__(self, custom_error: CustomError):  # pylint: disable=super-init-not-called
         self._name = "revert " + custom_error.solidity_signature
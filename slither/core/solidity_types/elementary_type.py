@@ -144,6 +144,8 @@ Fixed = [f"fixed{m}x{n}" for (m, n) in MN] + ["fixed"]
 Ufixed = [f"ufixed{m}x{n}" for (m, n) in MN] + ["ufixed"]
 
 ElementaryTypeName = ["address", "bool", "string", "var"] + Int + Uint + Byte + Fixed + Ufixed
+# Membership is tested for every parsed type name, avoid scanning the ~5000 names of the list
+ElementaryTypeNameSet = frozenset(ElementaryTypeName)
 
 
 class NonElementaryType(Exception):
@@ -152,7 +154,7 @@ class NonElementaryType(Exception):
 
 class ElementaryType(Type):
     def __init__(self, t: str) -> None:
-        if t not in ElementaryTypeName:
+        if t not in ElementaryTypeNameSet:
             raise NonElementaryType
         super().__init__()
         if t == "uint":
@@ -18,6 +18,18 @@ if TYPE_CHECKING:
 
 # pylint: disable=too-many-instance-attributes
 class Source:
+    __slots__ = [
+        "start",
+        "length",
+        "filename",
+        "is_dependency",
+        "lines",
+        "starting_column",
+        "ending_column",
+        "end",
+        "compilation_unit",
+    ]
+
     def __init__(self) -> None:
         self.start: int = 0
         self.length: int = 0
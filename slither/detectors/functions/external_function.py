@@ -1,8 +1,9 @@
-from typing import List, Set
+from typing import Dict, List, Set
 
 from slither.core.declarations import Function, FunctionContract, Contract
 from slither.core.declarations.structure import Structure
 from slither.core.solidity_types.array_type import ArrayType
+from slither.core.solidity_types.elementary_type import ElementaryType
 from slither.core.solidity_types.user_defined_type import UserDefinedType
 from slither.core.variables.variable import Variable
 from slither.detectors.abstract_detector import (
@@ -137,8 +138,8 @@ class ExternalFunction(AbstractDetector):
             parameter_type.type, Structure
         ):
             return True
-        if str(parameter_type) in ["bytes", "string"]:
-            return True
+        if isinstance(parameter_type, ElementaryType):
+            return parameter_type.name in ("bytes", "string")
         return False
 
     def _detect(self) -> List[Output]:  # pylint: disable=too-many-locals,too-many-branches
@@ -152,6 +153,10 @@ class ExternalFunction(AbstractDetector):
         # of, or override hierarchically are processed together).
         completed_functions: Set[Function] = set()
 
+        # Memoize the functions called by each contract, as a contract is a possible source
+        # for every function declared in its bases
+        functions_called_by_contract: Dict[Contract, Set[Function]] = {}
+
         # First we build our set of all contracts with dynamic calls
         for contract in self.contracts:
             if self._contains_internal_dynamic_call(contract):
@@ -167,18 +172,20 @@ class ExternalFunction(AbstractDetector):
             # Next we'll want to loop through all functions defined directly in this contract.
             for function in contract.functions_declared:
 
-                # If all of the function arguments are non-reference type or calldata, we skip it.
-                reference_args = []
-                for arg in function.parameters:
-                    if self.is_reference_type(arg) and arg.location == "memory":
-                        reference_args.append(arg)
-                if len(reference_args) == 0:
-                    continue
-
                 # If the function is a constructor, or is public, we skip it.
+                # This is the cheapest filter and rejects most functions, so it runs first.
                 if function.is_constructor or function.visibility != "public":
                     continue
 
+                # If all of the function arguments are non-reference type or calldata, we skip it.
+                reference_args = [
+                    arg
+                    for arg in function.parameters
+                    if arg.location == "memory" and self.is_reference_type(arg)
+                ]
+                if not reference_args:
+                    continue
+
                 # Optimization: If this function has already been processed, we stop.
                 if function in completed_functions:
                     continue
@@ -222,8 +229,11 @@ class ExternalFunction(AbstractDetector):
                 # otherwise, this is a candidate (in all sources) to be changed visibility for.
                 is_called = False
                 for possible_source in all_possible_sources:
-                    functions_called = self.detect_functions_called(possible_source)
-                    if set(functions_called) & all_function_definitions:
+                    functions_called = functions_called_by_contract.get(possible_source)
+                    if functions_called is None:
+                        functions_called = set(self.detect_functions_called(possible_source))
+                        functions_called_by_contract[possible_source] = functions_called
+                    if functions_called & all_function_definitions:
                         is_called = True
                         break
 
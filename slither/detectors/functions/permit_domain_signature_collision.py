@@ -9,6 +9,8 @@ from slither.core.variables.state_variable import StateVariable
 from slither.detectors.abstract_detector import AbstractDetector, DetectorClassification
 from slither.utils.function import get_function_id
 
+bytes32_type = ElementaryType("bytes32")
+
 
 class DomainSeparatorCollision(AbstractDetector):
     """
@@ -45,22 +47,23 @@ contract Contract{
             if contract.is_erc20():
                 funcs_and_vars: List[Union[Function, StateVariable]] = contract.functions_entry_points + contract.state_variables_entry_points  # type: ignore
                 for func_or_var in funcs_and_vars:
+                    signature = func_or_var.solidity_signature
                     # External/ public function names should not collide with DOMAIN_SEPARATOR()
                     hash_collision = (
-                        func_or_var.solidity_signature != "DOMAIN_SEPARATOR()"
-                        and get_function_id(func_or_var.solidity_signature) == domain_sig
+                        signature != "DOMAIN_SEPARATOR()"
+                        and get_function_id(signature) == domain_sig
                     )
                     # DOMAIN_SEPARATOR() should return bytes32
-                    incorrect_return_type = func_or_var.solidity_signature == "DOMAIN_SEPARATOR()"
+                    incorrect_return_type = signature == "DOMAIN_SEPARATOR()"
                     if incorrect_return_type:
                         if isinstance(func_or_var, Function):
                             incorrect_return_type = (
                                 not func_or_var.return_type
-                                or func_or_var.return_type[0] != ElementaryType("bytes32")
+                                or func_or_var.return_type[0] != bytes32_type
                             )
                         else:
                             assert isinstance(func_or_var, StateVariable)
-                            incorrect_return_type = func_or_var.type != ElementaryType("bytes32")
+                            incorrect_return_type = func_or_var.type != bytes32_type
                     if hash_collision or incorrect_return_type:
                         info = [
                             "The function signature of ",
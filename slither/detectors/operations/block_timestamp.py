@@ -15,24 +15,27 @@ from slither.detectors.abstract_detector import AbstractDetector, DetectorClassi
 from slither.slithir.operations import Binary, BinaryType
 
 
+block_timestamp = SolidityVariableComposed("block.timestamp")
+now = SolidityVariable("now")
+
+
+def _depends_on_timestamp(var, contract: Contract) -> bool:
+    return is_dependent(var, block_timestamp, contract) or is_dependent(var, now, contract)
+
+
 def _timestamp(func: Function) -> List[Node]:
     ret = set()
     for node in func.nodes:
+        # A node is reported once, stop querying the data dependency as soon as it matches
         if node.contains_require_or_assert():
-            for var in node.variables_read:
-                if is_dependent(var, SolidityVariableComposed("block.timestamp"), func.contract):
-                    ret.add(node)
-                if is_dependent(var, SolidityVariable("now"), func.contract):
-                    ret.add(node)
+            if any(_depends_on_timestamp(var, func.contract) for var in node.variables_read):
+                ret.add(node)
+                continue
         for ir in node.irs:
             if isinstance(ir, Binary) and BinaryType.return_bool(ir.type):
-                for var in ir.read:
-                    if is_dependent(
-                        var, SolidityVariableComposed("block.timestamp"), func.contract
-                    ):
-                        ret.add(node)
-                    if is_dependent(var, SolidityVariable("now"), func.contract):
-                        ret.add(node)
+                if any(_depends_on_timestamp(var, func.contract) for var in ir.read):
+                    ret.add(node)
+                    break
     return sorted(list(ret), key=lambda x: x.node_id)
 
 
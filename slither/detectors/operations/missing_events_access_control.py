@@ -8,6 +8,8 @@ from slither.analyses.data_dependency.data_dependency import is_tainted
 from slither.slithir.operations.event_call import EventCall
 from slither.core.solidity_types.elementary_type import ElementaryType
 
+address_type = ElementaryType("address")
+
 
 class MissingEventsAccessControl(AbstractDetector):
     """
@@ -72,7 +74,7 @@ contract C {
             # Heuristic-4: Critical operations present but no events in the function is not a good practice
             for node in function.nodes:
                 for sv in node.state_variables_written:
-                    if is_tainted(sv, function) and sv.type == ElementaryType("address"):
+                    if sv.type == address_type and is_tainted(sv, function):
                         for mod in function.contract.modifiers:
                             if sv in mod.state_variables_read:
                                 nodes.append((node, sv, mod))
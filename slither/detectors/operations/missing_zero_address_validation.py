@@ -10,6 +10,8 @@ from slither.core.solidity_types.elementary_type import ElementaryType
 from slither.slithir.operations import Send, Transfer, LowLevelCall
 from slither.slithir.operations import Call
 
+address_type = ElementaryType("address")
+
 
 class MissingZeroAddressValidation(AbstractDetector):
     """
@@ -96,15 +98,10 @@ Bob calls `updateOwner` without specifying the `newOwner`, so Bob loses ownershi
 
             for node in function.nodes:
                 sv_addrs_written = [
-                    sv
-                    for sv in node.state_variables_written
-                    if sv.type == ElementaryType("address")
+                    sv for sv in node.state_variables_written if sv.type == address_type
                 ]
 
-                addr_calls = False
-                for ir in node.irs:
-                    if isinstance(ir, (Send, Transfer, LowLevelCall)):
-                        addr_calls = True
+                addr_calls = any(isinstance(ir, (Send, Transfer, LowLevelCall)) for ir in node.irs)
 
                 # Continue if no address-typed state variables are written and if no send/transfer/call
                 if not sv_addrs_written and not addr_calls:
@@ -113,7 +110,7 @@ Bob calls `updateOwner` without specifying the `newOwner`, so Bob loses ownershi
                 # Check local variables used in such nodes
                 for var in node.local_variables_read:
                     # Check for address types that are tainted but not by msg.sender
-                    if var.type == ElementaryType("address") and is_tainted(
+                    if var.type == address_type and is_tainted(
                         var, function, ignore_generic_taint=True
                     ):
                         # Check for zero address validation of variable
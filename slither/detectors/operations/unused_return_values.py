@@ -68,7 +68,8 @@ contract MyConc{
                         values_returned.append(ir.lvalue)
                         nodes_origin[ir.lvalue] = ir
                 for read in ir.read:
-                    if read in values_returned:
+                    # nodes_origin holds every value ever returned, check it before the list scan
+                    if read in nodes_origin and read in values_returned:
                         values_returned.remove(read)
 
         return [nodes_origin[value].node for value in values_returned]
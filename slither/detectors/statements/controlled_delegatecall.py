@@ -3,7 +3,14 @@ from slither.slithir.operations import LowLevelCall
 from slither.analyses.data_dependency.data_dependency import is_tainted
 
 
+def _has_delegatecall(function):
+    # Most functions do not delegatecall, use the low level calls summary to skip their nodes
+    return any(name in ["delegatecall", "callcode"] for _, name in function.low_level_calls)
+
+
 def controlled_delegatecall(function):
+    # Walks all the nodes of the function, ControlledDelegateCall._detect
+    # filters with _has_delegatecall first to skip most of the functions
     ret = []
     for node in function.nodes:
         for ir in node.irs:
@@ -47,6 +54,9 @@ Bob calls `delegate` and delegates the execution to his malicious contract. As a
 
         for contract in self.compilation_unit.contracts_derived:
             for f in contract.functions:
+                # Cheap syntactic filter, run before the proxy and protection checks
+                if not _has_delegatecall(f):
+                    continue
                 # If its an upgradeable proxy, do not report protected function
                 # As functions to upgrades the destination lead to too many FPs
                 if contract.is_upgradeable_proxy and f.is_protected():
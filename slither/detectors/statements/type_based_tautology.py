@@ -18,6 +18,12 @@ def typeRange(t):
     return None
 
 
+# Ranges of every integer type name, "int"/"uint" being aliases of the 256 bits types
+int_ranges = {t: typeRange(t) for t in Int + Uint if t not in ["int", "uint"]}
+int_ranges["int"] = int_ranges["int256"]
+int_ranges["uint"] = int_ranges["uint256"]
+
+
 def _detect_tautology_or_contradiction(low, high, cval, op):
     """
     Return true if "[low high] op cval " is always true or always false
@@ -119,7 +125,6 @@ contract A {
 
         # Create our result set.
         results = []
-        allInts = Int + Uint
 
         # Loop for each function and modifier.
         for function in contract.functions_declared:  # pylint: disable=too-many-nested-blocks
@@ -131,9 +136,9 @@ contract A {
                         # If neither side is a constant, we can't do much
                         if isinstance(ir.variable_left, Constant):
                             cval = ir.variable_left.value
-                            rtype = str(ir.variable_right.type)
-                            if rtype in allInts:
-                                (low, high) = typeRange(rtype)
+                            rtype_range = int_ranges.get(str(ir.variable_right.type))
+                            if rtype_range:
+                                (low, high) = rtype_range
                                 if _detect_tautology_or_contradiction(
                                     low, high, cval, self.flip_table[ir.type]
                                 ):
@@ -141,9 +146,9 @@ contract A {
 
                         if isinstance(ir.variable_right, Constant):
                             cval = ir.variable_right.value
-                            ltype = str(ir.variable_left.type)
-                            if ltype in allInts:
-                                (low, high) = typeRange(ltype)
+                            ltype_range = int_ranges.get(str(ir.variable_left.type))
+                            if ltype_range:
+                                (low, high) = ltype_range
                                 if _detect_tautology_or_contradiction(low, high, cval, ir.type):
                                     f_results.add(node)
             results.append((function, f_results))
@@ -1,7 +1,8 @@
 from typing import List
 
-from slither.core.declarations import SolidityFunction, Function
+from slither.core.declarations import Function
 from slither.core.declarations.contract import Contract
+from slither.core.declarations.solidity_variables import destroy_functions
 from slither.detectors.abstract_detector import AbstractDetector, DetectorClassification
 from slither.slithir.operations import LowLevelCall, SolidityCall
 
@@ -12,11 +13,7 @@ def _can_be_destroyed(contract: Contract) -> List[Function]:
         for ir in f.all_slithir_operations():
             if (
                 isinstance(ir, LowLevelCall) and ir.function_name in ["delegatecall", "codecall"]
-            ) or (
-                isinstance(ir, SolidityCall)
-                and ir.function
-                in [SolidityFunction("suicide(address)"), SolidityFunction("selfdestruct(address)")]
-            ):
+            ) or (isinstance(ir, SolidityCall) and ir.function in destroy_functions):
                 targets.append(f)
                 break
     return targets
@@ -42,13 +39,11 @@ def _has_initializing_protection(functions: List[Function]) -> bool:
 def _whitelisted_modifiers(f: Function) -> bool:
     # The onlyProxy modifier prevents calling the implementation contract (must be delegatecall)
     #  https://github.com/OpenZeppelin/openzeppelin-contracts-upgradeable/blob/3dec82093ea4a490d63aab3e925fed4f692909e8/contracts/proxy/utils/UUPSUpgradeable.sol#L38-L42
-    return "onlyProxy" not in [modifier.name for modifier in f.modifiers]
+    return all(modifier.name != "onlyProxy" for modifier in f.modifiers)
 
 
 def _initialize_functions(contract: Contract) -> List[Function]:
-    return list(
-        filter(_whitelisted_modifiers, [f for f in contract.functions if f.name == "initialize"])
-    )
+    return [f for f in contract.functions if f.name == "initialize" and _whitelisted_modifiers(f)]
 
 
 class UnprotectedUpgradeable(AbstractDetector):
@@ -92,11 +87,14 @@ Buggy is an upgradeable contract. Anyone can call initialize on the logic contra
 
         for contract in self.compilation_unit.contracts_derived:
             if contract.is_upgradeable:
+                # Without an initialize function there is nothing to report,
+                # so check it before walking the IRs of every entry point
+                initialize_functions = _initialize_functions(contract)
+                if not initialize_functions:
+                    continue
                 if not _has_initializing_protection(contract.constructors):
                     functions_that_can_destroy = _can_be_destroyed(contract)
                     if functions_that_can_destroy:
-                        initialize_functions = _initialize_functions(contract)
-
                         vars_init_ = [
                             init.all_state_variables_written() for init in initialize_functions
                         ]
@@ -35,14 +35,11 @@ def _handle_ir(
         if ir.function.all_high_level_calls() or ir.function.all_library_calls():
             _remove_states(written)
 
+        # all_state_variables_read only returns (non-SSA) state variables,
+        # so the Variable/SlithIRVariable checks done on ir.read are not needed here
         all_read = ir.function.all_state_variables_read()
         for read in all_read:
-            if (
-                isinstance(read, Variable)
-                and isinstance(read.type, ElementaryType)
-                and not isinstance(read, SlithIRVariable)
-                and read in written
-            ):
+            if isinstance(read.type, ElementaryType) and read in written:
                 del written[read]
 
     for read in ir.read:
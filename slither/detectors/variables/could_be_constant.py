@@ -3,7 +3,7 @@ from slither.utils.output import Output
 from slither.core.compilation_unit import SlitherCompilationUnit
 from slither.formatters.variables.unchanged_state_variables import custom_format
 from slither.detectors.abstract_detector import AbstractDetector, DetectorClassification
-from .unchanged_state_variables import UnchangedStateVariables
+from .unchanged_state_variables import get_unchanged_state_variables
 
 
 class CouldBeConstant(AbstractDetector):
@@ -29,8 +29,7 @@ class CouldBeConstant(AbstractDetector):
         """Detect state variables that could be constant"""
         results = {}
 
-        unchanged_state_variables = UnchangedStateVariables(self.compilation_unit)
-        unchanged_state_variables.detect()
+        unchanged_state_variables = get_unchanged_state_variables(self.compilation_unit)
 
         for variable in unchanged_state_variables.constant_candidates:
             results[variable.canonical_name] = self.generate_result(
@@ -86,6 +86,9 @@ class UnchangedStateVariables:
 
     def detect(self):
         """Detect state variables that could be constant or immutable"""
+        supports_immutable = version.parse(self.compilation_unit.solc_version) >= version.parse(
+            "0.6.5"
+        )
         for c in self.compilation_unit.contracts_derived:
             variables = []
             functions = []
@@ -117,9 +120,24 @@ class UnchangedStateVariables:
                     if _constant_initial_expression(v) and v not in constructor_variables_written:
                         self.constant_candidates.append(v)
 
-                    elif (
+                    elif supports_immutable and (
                         v in constructor_variables_written or v in variables_initialized
-                    ) and version.parse(self.compilation_unit.solc_version) >= version.parse(
-                        "0.6.5"
                     ):
                         self.immutable_candidates.append(v)
+
+
+KEY = "UNCHANGED_STATE_VARIABLES"
+
+
+def get_unchanged_state_variables(
+    compilation_unit: SlitherCompilationUnit,
+) -> UnchangedStateVariables:
+    """
+    Return the analysis of the compilation unit
+    It is computed once and shared between the constant and immutable detectors
+    """
+    if KEY not in compilation_unit.context:
+        unchanged_state_variables = UnchangedStateVariables(compilation_unit)
+        unchanged_state_variables.detect()
+        compilation_unit.context[KEY] = unchanged_state_variables
+    return compilation_unit.context[KEY]
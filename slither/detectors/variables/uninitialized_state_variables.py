@@ -9,10 +9,17 @@
     Only analyze "leaf" contracts (contracts that are not inherited by another contract)
 """
 
+from logging import Logger
+from typing import TYPE_CHECKING, List, Optional
+
+from slither.core.compilation_unit import SlitherCompilationUnit
 from slither.detectors.abstract_detector import AbstractDetector, DetectorClassification
 from slither.slithir.operations import InternalCall, LibraryCall
 from slither.slithir.variables import ReferenceVariable
 
+if TYPE_CHECKING:
+    from slither import Slither
+
 
 class UninitializedStateVarsDetection(AbstractDetector):
     """
@@ -50,6 +57,13 @@ Initialize all the variables. If a variable is meant to be initialized to zero,
 """
     # endregion wiki_recommendation
 
+    def __init__(
+        self, compilation_unit: SlitherCompilationUnit, slither: "Slither", logger: Logger
+    ):
+        super().__init__(compilation_unit, slither, logger)
+        # Names of the variables written in the upgradeable proxies, computed on first use
+        self._proxy_written_variable_names: Optional[List[str]] = None
+
     @staticmethod
     def _written_variables(contract):
         ret = []
@@ -58,35 +72,28 @@ Initialize all the variables. If a variable is meant to be initialized to zero,
             for n in f.nodes:
                 ret += n.state_variables_written
                 for ir in n.irs:
-                    if isinstance(ir, (LibraryCall, InternalCall)):
-                        idx = 0
-                        if ir.function:
-                            for param in ir.function.parameters:
-                                if param.location == "storage":
-                                    # If its a storage variable, add either the variable
-                                    # Or the variable it points to if its a reference
-                                    if isinstance(ir.arguments[idx], ReferenceVariable):
-                                        ret.append(ir.arguments[idx].points_to_origin)
-                                    else:
-                                        ret.append(ir.arguments[idx])
-                                idx = idx + 1
+                    if not isinstance(ir, (LibraryCall, InternalCall)) or not ir.function:
+                        continue
+                    for param, arg in zip(ir.function.parameters, ir.arguments):
+                        if param.location != "storage":
+                            continue
+                        # If its a storage variable, add either the variable
+                        # Or the variable it points to if its a reference
+                        if isinstance(arg, ReferenceVariable):
+                            ret.append(arg.points_to_origin)
+                        else:
+                            ret.append(arg)
 
         return ret
 
     def _variable_written_in_proxy(self):
-        # Hack to memoize without having it define in the init
-        if hasattr(self, "__variables_written_in_proxy"):
-            # pylint: disable=access-member-before-definition
-            return self.__variables_written_in_proxy
-
-        variables_written_in_proxy = []
-        for c in self.compilation_unit.contracts:
-            if c.is_upgradeable_proxy:
-                variables_written_in_proxy += self._written_variables(c)
-
-        # pylint: disable=attribute-defined-outside-init
-        self.__variables_written_in_proxy = list({v.name for v in variables_written_in_proxy})
-        return self.__variables_written_in_proxy
+        if self._proxy_written_variable_names is None:
+            variables_written_in_proxy = []
+            for c in self.compilation_unit.contracts:
+                if c.is_upgradeable_proxy:
+                    variables_written_in_proxy += self._written_variables(c)
+            self._proxy_written_variable_names = list({v.name for v in variables_written_in_proxy})
+        return self._proxy_written_variable_names
 
     def _written_variables_in_proxy(self, contract):
         variables = []
@@ -109,12 +116,17 @@ Initialize all the variables. If a variable is meant to be initialized to zero,
         return ret
 
     def _detect_uninitialized(self, contract):
-        written_variables = self._written_variables(contract)
-        written_variables += self._written_variables_in_proxy(contract)
-        read_variables = self._read_variables(contract)
+        state_variables = contract.state_variables
+        # No need to collect the written and read variables if there is nothing to report
+        if not state_variables:
+            return []
+        # Sets, as every state variable of the contract is looked up in them
+        written_variables = set(self._written_variables(contract))
+        written_variables.update(self._written_variables_in_proxy(contract))
+        read_variables = set(self._read_variables(contract))
         return [
             (variable, contract.get_functions_reading_from_variable(variable))
-            for variable in contract.state_variables
+            for variable in state_variables
             if variable not in written_variables
             and not variable.expression
             and variable in read_variables
@@ -21,13 +21,12 @@ class PrinterWrittenVariablesAndAuthorization(AbstractPrinter):
         all_nodes = [f.nodes for f in all_functions if isinstance(f, Function)]
         all_nodes = [item for sublist in all_nodes for item in sublist]
 
-        all_conditional_nodes = [
-            n for n in all_nodes if n.contains_if() or n.contains_require_or_assert()
-        ]
+        # Only the matching nodes are stringified, and the msg.sender test stops at the first hit
         all_conditional_nodes_on_msg_sender = [
             str(n.expression)
-            for n in all_conditional_nodes
-            if "msg.sender" in [v.name for v in n.solidity_variables_read]
+            for n in all_nodes
+            if (n.contains_if() or n.contains_require_or_assert())
+            and any(v.name == "msg.sender" for v in n.solidity_variables_read)
         ]
         return all_conditional_nodes_on_msg_sender
 
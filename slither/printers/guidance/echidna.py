@@ -9,6 +9,7 @@ from slither.core.declarations.solidity_variables import (
     SolidityVariableComposed,
     SolidityFunction,
     SolidityVariable,
+    destroy_functions,
 )
 from slither.core.expressions import NewContract
 from slither.core.slither_core import SlitherCore
@@ -32,6 +33,8 @@ from slither.slithir.operations.binary import Binary
 from slither.slithir.variables import Constant
 from slither.visitors.expression.constants_folding import ConstantFolding
 
+assert_function = SolidityFunction("assert(bool)")
+
 
 def _get_name(f: Union[Function, Variable]) -> str:
     # Return the name of the function or variable
@@ -57,10 +60,8 @@ def _extract_solidity_variable_usage(
     for contract in slither.contracts:
         functions_using_sol_var = []
         for f in contract.functions_entry_points:
-            for v in f.all_solidity_variables_read():
-                if v == sol_var:
-                    functions_using_sol_var.append(_get_name(f))
-                    break
+            if sol_var in f.all_solidity_variables_read():
+                functions_using_sol_var.append(_get_name(f))
         if functions_using_sol_var:
             ret[contract.name] = functions_using_sol_var
     return ret
@@ -93,10 +94,7 @@ def _is_constant(f: Function) -> bool:  # pylint: disable=too-many-branches
             return False
         if isinstance(ir, (EventCall, NewContract, LowLevelCall, Send, Transfer)):
             return False
-        if isinstance(ir, SolidityCall) and ir.function in [
-            SolidityFunction("selfdestruct(address)"),
-            SolidityFunction("suicide(address)"),
-        ]:
+        if isinstance(ir, SolidityCall) and ir.function in destroy_functions:
             return False
         if isinstance(ir, HighLevelCall):
             if isinstance(ir.function, Variable) or ir.function.view or ir.function.pure:
@@ -129,10 +127,8 @@ def _extract_assert(slither: SlitherCore) -> Dict[str, List[str]]:
     for contract in slither.contracts:
         functions_using_assert = []
         for f in contract.functions_entry_points:
-            for v in f.all_solidity_calls():
-                if v == SolidityFunction("assert(bool)"):
-                    functions_using_assert.append(_get_name(f))
-                    break
+            if assert_function in f.all_solidity_calls():
+                functions_using_assert.append(_get_name(f))
         if functions_using_assert:
             ret[contract.name] = functions_using_assert
     return ret
@@ -171,9 +167,10 @@ def _extract_constants_from_irs(  # pylint: disable=too-many-branches,too-many-n
 ):
     for ir in irs:
         if isinstance(ir, Binary):
+            binary_type = str(ir.type)
             for r in ir.read:
                 if isinstance(r, Constant):
-                    all_cst_used_in_binary[str(ir.type)].append(
+                    all_cst_used_in_binary[binary_type].append(
                         ConstantValue(str(r.value), str(r.type))
                     )
             if isinstance(ir.variable_left, Constant) and isinstance(ir.variable_right, Constant):
@@ -185,10 +182,10 @@ def _extract_constants_from_irs(  # pylint: disable=too-many-branches,too-many-n
             if isinstance(ir.variable, Constant):
                 all_cst_used.append(ConstantValue(str(ir.variable.value), str(ir.type)))
                 continue
+        # Do not report struct_name in a.struct_name
+        if isinstance(ir, Member):
+            continue
         for r in ir.read:
-            # Do not report struct_name in a.struct_name
-            if isinstance(ir, Member):
-                continue
             if isinstance(r, Constant):
                 all_cst_used.append(ConstantValue(str(r.value), str(r.type)))
             if isinstance(r, StateVariable):
@@ -304,18 +301,16 @@ def _use_balance(slither: SlitherCore) -> Dict[str, List[str]]:
 def _with_fallback(slither: SlitherCore) -> Set[str]:
     ret: Set[str] = set()
     for contract in slither.contracts:
-        for function in contract.functions_entry_points:
-            if function.is_fallback:
-                ret.add(contract.name)
+        if any(function.is_fallback for function in contract.functions_entry_points):
+            ret.add(contract.name)
     return ret
 
 
 def _with_receive(slither: SlitherCore) -> Set[str]:
     ret: Set[str] = set()
     for contract in slither.contracts:
-        for function in contract.functions_entry_points:
-            if function.is_receive:
-                ret.add(contract.name)
+        if any(function.is_receive for function in contract.functions_entry_points):
+            ret.add(contract.name)
     return ret
 
 
@@ -392,11 +387,11 @@ class Echidna(AbstractPrinter):
 
         functions_relations = _extract_function_relations(self.slither)
 
-        constructors = {
-            contract.name: contract.constructor.full_name
-            for contract in self.slither.contracts
-            if contract.constructor
-        }
+        constructors = {}
+        for contract in self.slither.contracts:
+            constructor = contract.constructor
+            if constructor:
+                constructors[contract.name] = constructor.full_name
 
         external_calls = _have_external_calls(self.slither)
 
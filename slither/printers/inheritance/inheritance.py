@@ -4,6 +4,8 @@
     The inheritance shows the relation between the contracts
 """
 
+from collections import defaultdict
+
 from slither.printers.abstract_printer import AbstractPrinter
 from slither.utils.colors import blue, green
 
@@ -14,11 +16,14 @@ class PrinterInheritance(AbstractPrinter):
 
     WIKI = "https://github.com/trailofbits/slither/wiki/Printer-documentation#inheritance"
 
-    def _get_child_contracts(self, base):
-        # Generate function to get all child contracts of a base contract
+    def _get_child_contracts(self):
+        # Map each base contract to its child contracts, built once instead of
+        # scanning every contract for each base
+        children = defaultdict(list)
         for child in self.contracts:
-            if base in child.inheritance:
-                yield child
+            for base in set(child.inheritance):
+                children[base].append(child)
+        return children
 
     def output(self, filename):
         """
@@ -57,11 +62,12 @@ class PrinterInheritance(AbstractPrinter):
         info += blue(" [Not_Immediate_Child_Contracts]") + "\n"
 
         result["base_to_child"] = {}
+        child_contracts = self._get_child_contracts()
         for base in self.contracts:
             if base.is_top_level:
                 continue
             info += green(f"\n+ {base.name}") + "\n"
-            children = list(self._get_child_contracts(base))
+            children = child_contracts.get(base, [])
 
             result["base_to_child"][base.name] = {"immediate": [], "not_immediate": []}
             if children:
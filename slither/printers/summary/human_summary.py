@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Tuple, List, Dict
 
 from slither.core.declarations import SolidityFunction, Function
+from slither.core.declarations.solidity_variables import destroy_functions
 from slither.core.variables.state_variable import StateVariable
 from slither.printers.abstract_printer import AbstractPrinter
 from slither.slithir.operations import (
@@ -23,6 +24,8 @@ from slither.utils.standard_libraries import is_standard_library
 from slither.core.cfg.node import NodeType
 from slither.utils.tests_pattern import is_test_file
 
+ecrecover_function = SolidityFunction("ecrecover(bytes32,uint8,bytes32,bytes32)")
+
 
 class PrinterHumanSummary(AbstractPrinter):
     ARGUMENT = "human-summary"
@@ -190,10 +193,13 @@ class PrinterHumanSummary(AbstractPrinter):
         total_asm_lines = 0
         for contract in self.contracts:
             for function in contract.functions_declared:
+                # The parser flags functions with inline assembly, no need to walk the others
+                if not function.contains_assembly:
+                    continue
                 for node in function.nodes:
                     if node.type == NodeType.ASSEMBLY:
                         inline_asm = node.inline_asm
-                        if inline_asm:
+                        if isinstance(inline_asm, str):
                             total_asm_lines += len(inline_asm.splitlines())
         return total_asm_lines
 
@@ -257,14 +263,9 @@ class PrinterHumanSummary(AbstractPrinter):
             for ir in function.slithir_operations:
                 if isinstance(ir, (LowLevelCall, HighLevelCall, Send, Transfer)) and ir.call_value:
                     can_send_eth = True
-                if isinstance(ir, SolidityCall) and ir.function in [
-                    SolidityFunction("suicide(address)"),
-                    SolidityFunction("selfdestruct(address)"),
-                ]:
+                if isinstance(ir, SolidityCall) and ir.function in destroy_functions:
                     can_selfdestruct = True
-                if isinstance(ir, SolidityCall) and ir.function == SolidityFunction(
-                    "ecrecover(bytes32,uint8,bytes32,bytes32)"
-                ):
+                if isinstance(ir, SolidityCall) and ir.function == ecrecover_function:
                     has_ecrecover = True
                 if isinstance(ir, LowLevelCall) and ir.function_name in [
                     "delegatecall",
@@ -362,12 +363,14 @@ class PrinterHumanSummary(AbstractPrinter):
         table = MyPrettyTable(
             ["Name", "# functions", "ERCS", "ERC20 info", "Complex code", "Features"]
         )
+        results_contract = output.Output("")
+        # Single pass: the features and the complexity are shared by the table and the json output
         for contract in self.slither.contracts_derived:
 
             if contract.is_from_dependency() or contract.is_test:
                 continue
 
-            is_complex = self.is_complex_code(contract)
+            is_complex = self._is_complex_code(contract)
             number_functions = self._number_functions(contract)
             ercs = ",".join(contract.ercs())
             is_erc20 = contract.is_erc20()
@@ -375,9 +378,7 @@ class PrinterHumanSummary(AbstractPrinter):
             if is_erc20:
                 erc20_info += self.get_summary_erc20(contract)
 
-            features = "\n".join(
-                [name for name, to_print in self._get_features(contract).items() if to_print]
-            )
+            features = [name for name, to_print in self._get_features(contract).items() if to_print]
 
             table.add_row(
                 [
@@ -385,28 +386,19 @@ class PrinterHumanSummary(AbstractPrinter):
                     number_functions,
                     ercs,
                     erc20_info,
-                    is_complex,
-                    features,
+                    red("Yes") if is_complex else green("No"),
+                    "\n".join(features),
                 ]
             )
 
-        self.info(txt + "\n" + str(table))
-
-        results_contract = output.Output("")
-        for contract in self.slither.contracts_derived:
-            if contract.is_test or contract.is_from_dependency():
-                continue
-
             contract_d = {
                 "contract_name": contract.name,
-                "is_complex_code": self._is_complex_code(contract),
-                "is_erc20": contract.is_erc20(),
-                "number_functions": self._number_functions(contract),
-                "features": [
-                    name for name, to_print in self._get_features(contract).items() if to_print
-                ],
+                "is_complex_code": is_complex,
+                "is_erc20": is_erc20,
+                "number_functions": number_functions,
+                "features": features,
             }
-            if contract_d["is_erc20"]:
+            if is_erc20:
                 pause, mint_limited, race_condition_mitigated = self._get_summary_erc20(contract)
                 contract_d["erc20_pause"] = pause
                 if mint_limited is not None:
@@ -417,6 +409,8 @@ class PrinterHumanSummary(AbstractPrinter):
                 contract_d["erc20_race_condition_mitigated"] = race_condition_mitigated
             results_contract.add_contract(contract, additional_fields=contract_d)
 
+        self.info(txt + "\n" + str(table))
+
         results["contracts"]["elements"] = results_contract.elements
 
         json = self.generate_output(txt, additional_fields=results)
@@ -86,7 +86,6 @@ from slither.visitors.slithir.expression_to_slithir import ExpressionToSlithIR
 
 if TYPE_CHECKING:
     from slither.core.cfg.node import Node
-    from slither.core.compilation_unit import SlitherCompilationUnit
 
 logger = logging.getLogger("ConvertToIR")
 
@@ -251,14 +250,16 @@ def _find_function_from_parameter(
                 if arg_type.type == "string":
                     type_args += ["string"]
 
+        # type_args can hold many candidates types (ex: all the uint sizes)
+        # so convert the parameters' types to str once
+        params = [get_type(candidate.parameters[idx].type) for candidate in candidates]
         not_found = True
         candidates_kept = []
         for type_arg in type_args:
             if not not_found:
                 break
             candidates_kept = []
-            for candidate in candidates:
-                param = get_type(candidate.parameters[idx].type)
+            for candidate, param in zip(candidates, params):
                 if param == type_arg:
                     not_found = False
                     candidates_kept.append(candidate)
@@ -710,19 +711,22 @@ def propagate_types(ir, node: "Node"):  # pylint: disable=too-many-locals
                 t = None
                 ir_func = ir.function
                 # Handling of this.function_name usage
+                targeted_function = None
                 if (
                     left == SolidityVariable("this")
                     and isinstance(ir.variable_right, Constant)
                     and isinstance(ir_func, FunctionContract)
-                    and str(ir.variable_right) in [x.name for x in ir_func.contract.functions]
                 ):
                     # Assumption that this.function_name can only compile if
                     # And the contract does not have two functions starting with function_name
                     # Otherwise solc raises:
                     # Error: Member "f" not unique after argument-dependent lookup in contract
+                    # So the first match is the target, and the scan stops there
+                    function_name = str(ir.variable_right)
                     targeted_function = next(
-                        (x for x in ir_func.contract.functions if x.name == str(ir.variable_right))
+                        (x for x in ir_func.contract.functions if x.name == function_name), None
                     )
+                if targeted_function is not None:
                     t = _make_function_type(targeted_function)
                     ir.lvalue.set_type(t)
                 elif isinstance(left, (Variable, SolidityVariable)):
@@ -826,9 +830,12 @@ def extract_tmp_call(ins: TmpCall, contract: Optional[Contract]):  # pylint: dis
             call.call_id = ins.call_id
             return call
     if isinstance(ins.ori, Member):
+        member_name = str(ins.ori.variable_right)
         # If there is a call on an inherited contract, it is an internal call or an event
-        if contract and ins.ori.variable_left in contract.inheritance + [contract]:
-            if str(ins.ori.variable_right) in [f.name for f in contract.functions]:
+        if contract and (
+            ins.ori.variable_left == contract or contract.inherits_from(ins.ori.variable_left)
+        ):
+            if member_name in [f.name for f in contract.functions]:
                 internalcall = InternalCall(
                     (ins.ori.variable_right, ins.ori.variable_left.name),
                     ins.nbr_arguments,
@@ -838,7 +845,7 @@ def extract_tmp_call(ins: TmpCall, contract: Optional[Contract]):  # pylint: dis
                 internalcall.set_expression(ins.expression)
                 internalcall.call_id = ins.call_id
                 return internalcall
-            if str(ins.ori.variable_right) in [f.name for f in contract.events]:
+            if member_name in [f.name for f in contract.events]:
                 eventcall = EventCall(ins.ori.variable_right)
                 eventcall.set_expression(ins.expression)
                 eventcall.call_id = ins.call_id
@@ -855,17 +862,15 @@ def extract_tmp_call(ins: TmpCall, contract: Optional[Contract]):  # pylint: dis
             # lib L { event E()}
             # ...
             # emit L.E();
-            if str(ins.ori.variable_right) in [f.name for f in ins.ori.variable_left.events]:
+            if member_name in [f.name for f in ins.ori.variable_left.events]:
                 eventcall = EventCall(ins.ori.variable_right)
                 eventcall.set_expression(ins.expression)
                 eventcall.call_id = ins.call_id
                 return eventcall
 
             # lib Lib { error Error()} ... revert Lib.Error()
-            if str(ins.ori.variable_right) in ins.ori.variable_left.custom_errors_as_dict:
-                custom_error = ins.ori.variable_left.custom_errors_as_dict[
-                    str(ins.ori.variable_right)
-                ]
+            if member_name in ins.ori.variable_left.custom_errors_as_dict:
+                custom_error = ins.ori.variable_left.custom_errors_as_dict[member_name]
                 assert isinstance(
                     custom_error,
                     CustomError,
@@ -1085,8 +1090,10 @@ def extract_tmp_call(ins: TmpCall, contract: Optional[Contract]):  # pylint: dis
         return e
 
     if isinstance(ins.called, Contract):
+        # The constructor property scans the functions and the inheritance on each access
+        constructor = ins.called.constructor
         # Called a base constructor, where there is no constructor
-        if ins.called.constructor is None:
+        if constructor is None:
             return Nop()
         # Case where:
         # contract A{ constructor(uint) }
@@ -1094,11 +1101,9 @@ def extract_tmp_call(ins: TmpCall, contract: Optional[Contract]):  # pylint: dis
         # contract C is B{ constructor() A(10) B() {}
         # C calls B(), which does not exist
         # Ideally we should compare here for the parameters types too
-        if len(ins.called.constructor.parameters) != ins.nbr_arguments:
+        if len(constructor.parameters) != ins.nbr_arguments:
             return Nop()
-        internalcall = InternalCall(
-            ins.called.constructor, ins.nbr_arguments, ins.lvalue, ins.type_call
-        )
+        internalcall = InternalCall(constructor, ins.nbr_arguments, ins.lvalue, ins.type_call)
         internalcall.call_id = ins.call_id
         internalcall.set_expression(ins.expression)
         return internalcall
@@ -38,8 +38,6 @@ class Assignment(OperationWithLValue):
 
     def __str__(self):
         if isinstance(self.lvalue, ReferenceVariable):
-            points = self.lvalue.points_to
-            while isinstance(points, ReferenceVariable):
-                points = points.points_to
+            points = self.lvalue.points_to_origin
             return f"{self.lvalue} (->{points}) := {self.rvalue}({self.rvalue.type})"
         return f"{self.lvalue}({self.lvalue.type}) := {self.rvalue}({self.rvalue.type})"
@@ -183,9 +183,7 @@ class Binary(OperationWithLValue):
 
     def __str__(self):
         if isinstance(self.lvalue, ReferenceVariable):
-            points = self.lvalue.points_to
-            while isinstance(points, ReferenceVariable):
-                points = points.points_to
+            points = self.lvalue.points_to_origin
             return f"{str(self.lvalue)}(-> {points}) = {self.variable_left} {self.type_str} {self.variable_right}"
 
         return f"{str(self.lvalue)}({self.lvalue.type}) = {self.variable_left} {self.type_str} {self.variable_right}"
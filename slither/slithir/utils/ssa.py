@@ -402,8 +402,7 @@ def update_lvalue(
         if isinstance(new_ir, (Assignment, Binary)):
             if isinstance(lvalue, ReferenceVariable):
                 update_through_ref = True
-                while isinstance(lvalue, ReferenceVariable):
-                    lvalue = lvalue.points_to
+                lvalue = lvalue.points_to_origin
         if isinstance(lvalue, (LocalIRVariable, StateIRVariable)):
             if isinstance(lvalue, LocalIRVariable):
                 new_var = LocalIRVariable(lvalue)
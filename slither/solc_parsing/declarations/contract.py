@@ -20,9 +20,13 @@ from slither.solc_parsing.variables.state_variable import StateVariableSolc
 
 LOGGER = logging.getLogger("ContractSolcParsing")
 
+# Upgradeability annotations, see ContractSolc._handle_comment
+CUSTOM_COMMENT_PATTERN = re.compile(
+    r"@custom:(?:security (isDelegatecallProxy|isUpgradeable)|version name=([\w-]+))"
+)
+
 if TYPE_CHECKING:
     from slither.solc_parsing.slither_compilation_unit_solc import SlitherCompilationUnitSolc
-    from slither.core.slither_core import SlitherCore
     from slither.core.compilation_unit import SlitherCompilationUnit
 
 # pylint: disable=too-many-instance-attributes,import-outside-toplevel,too-many-nested-blocks,too-many-public-methods
@@ -772,17 +776,15 @@ class ContractSolc(CallerContextExpression):
             and attributes["documentation"] is not None
             and "text" in attributes["documentation"]
         ):
-            candidates = attributes["documentation"]["text"].replace("\n", ",").split(",")
+            text = attributes["documentation"]["text"]
 
-            for candidate in candidates:
-                if "@custom:security isDelegatecallProxy" in candidate:
+            for security, version_name in CUSTOM_COMMENT_PATTERN.findall(text):
+                if security == "isDelegatecallProxy":
                     self._contract.is_upgradeable_proxy = True
-                if "@custom:security isUpgradeable" in candidate:
+                elif security == "isUpgradeable":
                     self._contract.is_upgradeable = True
-
-                version_name = re.search(r"@custom:version name=([\w-]+)", candidate)
-                if version_name:
-                    self._contract.upgradeable_version = version_name.group(1)
+                else:
+                    self._contract.upgradeable_version = version_name
 
     # endregion
     ###################################################################################
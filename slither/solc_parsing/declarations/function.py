@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Optional, Union, List, TYPE_CHECKING
+from typing import Dict, Optional, Union, List, Set, TYPE_CHECKING
 
 from slither.core.cfg.node import NodeType, link_nodes, insert_node, Node
 from slither.core.cfg.scope import Scope
@@ -1103,18 +1103,20 @@ class FunctionSolc(CallerContextExpression):
 
         return None
 
-    def _find_start_loop(self, node: Node, visited: List[Node]) -> Optional[Node]:
-        if node in visited:
-            return None
+    def _find_start_loop(self, node: Node) -> Optional[Node]:
+        # Iterative DFS over the fathers, pushed in reverse to keep the recursive visit order
+        visited: Set[Node] = set()
+        to_explore = [node]
+        while to_explore:
+            node = to_explore.pop()
+            if node in visited:
+                continue
 
-        if node.type == NodeType.STARTLOOP:
-            return node
+            if node.type == NodeType.STARTLOOP:
+                return node
 
-        visited = visited + [node]
-        for father in node.fathers:
-            ret = self._find_start_loop(father, visited)
-            if ret:
-                return ret
+            visited.add(node)
+            to_explore.extend(reversed(node.fathers))
 
         return None
 
@@ -1135,7 +1137,7 @@ class FunctionSolc(CallerContextExpression):
         end_node.add_father(node)
 
     def _fix_continue_node(self, node: Node):
-        start_node = self._find_start_loop(node, [])
+        start_node = self._find_start_loop(node)
 
         if not start_node:
             raise ParsingError(f"Continue in no-loop context {node.node_id}")
@@ -220,11 +220,6 @@ def _parse_elementary_type_name_expression(
     return e
 
 
-if TYPE_CHECKING:
-
-    from slither.core.scope.scope import FileScope
-
-
 def parse_expression(expression: Dict, caller_context: CallerContextExpression) -> "Expression":
     # pylint: disable=too-many-nested-blocks,too-many-statements
     """
@@ -510,7 +505,10 @@ def parse_expression(expression: Dict, caller_context: CallerContextExpression)
             children = expression["children"]
             assert len(children) == 1
             member_expression = parse_expression(children[0], caller_context)
-        if str(member_expression) == "super":
+        # Only a bare identifier can be super or the base of a composed solidity variable,
+        # so deeper member chains are never stringified
+        is_identifier = isinstance(member_expression, Identifier)
+        if is_identifier and str(member_expression) == "super":
             super_name = parse_super_name(expression, is_compact_ast)
             var, was_created = find_variable(super_name, caller_context, is_super=True)
             if var is None:
@@ -525,10 +523,12 @@ def parse_expression(expression: Dict, caller_context: CallerContextExpression)
             return sup
         member_access = MemberAccess(member_name, member_type, member_expression)
         member_access.set_offset(src, caller_context.compilation_unit)
-        if str(member_access) in SOLIDITY_VARIABLES_COMPOSED:
-            id_idx = Identifier(SolidityVariableComposed(str(member_access)))
-            id_idx.set_offset(src, caller_context.compilation_unit)
-            return id_idx
+        if is_identifier:
+            member_access_str = str(member_access)
+            if member_access_str in SOLIDITY_VARIABLES_COMPOSED:
+                id_idx = Identifier(SolidityVariableComposed(member_access_str))
+                id_idx.set_offset(src, caller_context.compilation_unit)
+                return id_idx
         return member_access
 
     if name == "ElementaryTypeNameExpression":
@@ -10,7 +10,7 @@ from slither.core.solidity_types import TypeAlias
 from slither.core.solidity_types.array_type import ArrayType
 from slither.core.solidity_types.elementary_type import (
     ElementaryType,
-    ElementaryTypeName,
+    ElementaryTypeNameSet,
 )
 from slither.core.solidity_types.function_type import FunctionType
 from slither.core.solidity_types.mapping_type import MappingType
@@ -53,7 +53,7 @@ def _find_from_type_name(  # pylint: disable=too-many-locals,too-many-branches,t
     name_elementary = name.split(" ")[0]
     if "[" in name_elementary:
         name_elementary = name_elementary[0 : name_elementary.find("[")]
-    if name_elementary in ElementaryTypeName:
+    if name_elementary in ElementaryTypeNameSet:
         depth = name.count("[")
         if depth:
             return ArrayType(ElementaryType(name_elementary), Literal(depth, "uint256"))
@@ -264,6 +264,8 @@ binary_ops = {
 
 
 class YulBuiltin:  # pylint: disable=too-few-public-methods
+    __slots__ = ["_name"]
+
     def __init__(self, name: str) -> None:
         self._name = name
 
@@ -43,6 +43,8 @@ from slither.visitors.expression.write_var import WriteVar
 
 
 class YulNode:
+    __slots__ = ["_node", "_scope", "_unparsed_expression"]
+
     def __init__(self, node: Node, scope: "YulScope"):
         self._node = node
         self._scope = scope
@@ -93,7 +93,7 @@ class Flattening:
         :return:
         """
         for p in self._compilation_unit.pragma_directives:
-            if "ABIEncoderV2" in str(p.directive):
+            if p.is_abi_encoder_v2:
                 self._use_abi_encoder_v2 = True
                 return
 
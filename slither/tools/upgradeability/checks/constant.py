@@ -65,11 +65,11 @@ Do not remove `constant` from a state variables during an update.
         results = []
         while idx_v1 < len(state_variables_v1):
 
-            state_v1 = contract_v1.state_variables[idx_v1]
+            state_v1 = state_variables_v1[idx_v1]
             if len(state_variables_v2) <= idx_v2:
                 break
 
-            state_v2 = contract_v2.state_variables[idx_v2]
+            state_v2 = state_variables_v2[idx_v2]
 
             if state_v2:
                 if state_v1.is_constant:
@@ -152,11 +152,11 @@ Do not make an existing state variable `constant`.
         results = []
         while idx_v1 < len(state_variables_v1):
 
-            state_v1 = contract_v1.state_variables[idx_v1]
+            state_v1 = state_variables_v1[idx_v1]
             if len(state_variables_v2) <= idx_v2:
                 break
 
-            state_v2 = contract_v2.state_variables[idx_v2]
+            state_v2 = state_variables_v2[idx_v2]
 
             if state_v2:
                 if state_v1.is_constant:
@@ -5,19 +5,19 @@ from slither.tools.upgradeability.checks.abstract_checks import (
 )
 from slither.utils.function import get_function_id
 
+ENTRY_POINT_VISIBILITIES = frozenset(["public", "external"])
+
 
 def get_signatures(c):
     functions = c.functions
     functions = [
         f.full_name
         for f in functions
-        if f.visibility in ["public", "external"] and not f.is_constructor and not f.is_fallback
+        if f.visibility in ENTRY_POINT_VISIBILITIES and not f.is_constructor and not f.is_fallback
     ]
 
     variables = c.state_variables
-    variables = [
-        variable.name + "()" for variable in variables if variable.visibility in ["public"]
-    ]
+    variables = [variable.name + "()" for variable in variables if variable.visibility == "public"]
     return list(set(functions + variables))
 
 
@@ -29,7 +29,7 @@ def _get_function_or_variable(contract, signature):
 
     for variable in contract.state_variables:
         # Todo: can lead to incorrect variable in case of shadowing
-        if variable.visibility in ["public"]:
+        if variable.visibility == "public":
             if variable.name + "()" == signature:
                 return variable
 
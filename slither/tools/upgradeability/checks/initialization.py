@@ -41,8 +41,9 @@ def _get_all_internal_calls(function):
 def _get_most_derived_init(contract):
     init_functions = [f for f in contract.functions if not f.is_shadowed and f.name == "initialize"]
     if len(init_functions) > 1:
-        if len([f for f in init_functions if f.contract_declarer == contract]) == 1:
-            return next((f for f in init_functions if f.contract_declarer == contract))
+        init_functions_declared = [f for f in init_functions if f.contract_declarer == contract]
+        if len(init_functions_declared) == 1:
+            return init_functions_declared[0]
         raise MultipleInitTarget
     if init_functions:
         return init_functions[0]
@@ -268,8 +269,9 @@ Ensure all the initialize functions are reached by the most derived initialize f
             return []
 
         all_init_functions = _get_initialize_functions(self.contract)
-        all_init_functions_called = _get_all_internal_calls(most_derived_init) + [most_derived_init]
-        missing_calls = [f for f in all_init_functions if not f in all_init_functions_called]
+        all_init_functions_called = set(_get_all_internal_calls(most_derived_init))
+        all_init_functions_called.add(most_derived_init)
+        missing_calls = [f for f in all_init_functions if f not in all_init_functions_called]
         for f in missing_calls:
             info = ["Missing call to ", f, " in ", most_derived_init, ".\n"]
             json = self.generate_result(info)
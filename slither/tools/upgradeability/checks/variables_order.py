@@ -4,6 +4,17 @@ from slither.tools.upgradeability.checks.abstract_checks import (
 )
 
 
+def _get_storage_variables(contract):
+    """
+    Return the variables of the contract that use a storage slot, by order of declaration
+    """
+    return [
+        variable
+        for variable in contract.state_variables_ordered
+        if not (variable.is_constant or variable.is_immutable)
+    ]
+
+
 class MissingVariable(AbstractCheck):
     ARGUMENT = "missing-variables"
     IMPACT = CheckClassification.MEDIUM
@@ -48,24 +59,14 @@ Do not change the order of the state variables in the updated contract.
     def _check(self):
         contract1 = self.contract
         contract2 = self.contract_v2
-        order1 = [
-            variable
-            for variable in contract1.state_variables_ordered
-            if not (variable.is_constant or variable.is_immutable)
-        ]
-        order2 = [
-            variable
-            for variable in contract2.state_variables_ordered
-            if not (variable.is_constant or variable.is_immutable)
-        ]
+        order1 = _get_storage_variables(contract1)
+        order2 = _get_storage_variables(contract2)
 
         results = []
-        for idx, _ in enumerate(order1):
-            variable1 = order1[idx]
-            if len(order2) <= idx:
-                info = ["Variable missing in ", contract2, ": ", variable1, "\n"]
-                json = self.generate_result(info)
-                results.append(json)
+        for variable1 in order1[len(order2) :]:
+            info = ["Variable missing in ", contract2, ": ", variable1, "\n"]
+            json = self.generate_result(info)
+            results.append(json)
 
         return results
 
@@ -117,25 +118,12 @@ Avoid variables in the proxy. If a variable is in the proxy, ensure it has the s
     def _check(self):
         contract1 = self._contract1()
         contract2 = self._contract2()
-        order1 = [
-            variable
-            for variable in contract1.state_variables_ordered
-            if not (variable.is_constant or variable.is_immutable)
-        ]
-        order2 = [
-            variable
-            for variable in contract2.state_variables_ordered
-            if not (variable.is_constant or variable.is_immutable)
-        ]
+        order1 = _get_storage_variables(contract1)
+        order2 = _get_storage_variables(contract2)
 
         results = []
-        for idx, _ in enumerate(order1):
-            if len(order2) <= idx:
-                # Handle by MissingVariable
-                return results
-
-            variable1 = order1[idx]
-            variable2 = order2[idx]
+        # Variables past the end of order2 are handled by MissingVariable
+        for variable1, variable2 in zip(order1, order2):
             if (variable1.name != variable2.name) or (variable1.type != variable2.type):
                 info = [
                     "Different variables between ",
@@ -244,30 +232,14 @@ Avoid variables in the proxy. If a variable is in the proxy, ensure it has the s
     def _check(self):
         contract1 = self._contract1()
         contract2 = self._contract2()
-        order1 = [
-            variable
-            for variable in contract1.state_variables_ordered
-            if not (variable.is_constant or variable.is_immutable)
-        ]
-        order2 = [
-            variable
-            for variable in contract2.state_variables_ordered
-            if not (variable.is_constant or variable.is_immutable)
-        ]
+        order1 = _get_storage_variables(contract1)
+        order2 = _get_storage_variables(contract2)
 
         results = []
-
-        if len(order2) <= len(order1):
-            return []
-
-        idx = len(order1)
-
-        while idx < len(order2):
-            variable2 = order2[idx]
+        for variable2 in order2[len(order1) :]:
             info = ["Extra variables in ", contract2, ": ", variable2, "\n"]
             json = self.generate_result(info)
             results.append(json)
-            idx = idx + 1
 
         return results
 
@@ -35,22 +35,42 @@ def compute_strongly_connected_components(function: "Function") -> List[List["No
     components = []
     l = []
 
-    def visit(node):
-        if not visited[node]:
-            visited[node] = True
-            for son in node.sons:
-                visit(son)
-            l.append(node)
+    # Both traversals use an explicit stack of (node, iterator) pairs rather than recursion,
+    # so long CFGs do not hit the recursion limit. The visiting order is the same.
+    def visit(node: "Node"):
+        if visited[node]:
+            return
+        visited[node] = True
+        stack = [(node, iter(node.sons))]
+        while stack:
+            current, sons = stack[-1]
+            for son in sons:
+                if not visited[son]:
+                    visited[son] = True
+                    stack.append((son, iter(son.sons)))
+                    break
+            else:
+                stack.pop()
+                l.append(current)
 
     for n in function.nodes:
         visit(n)
 
     def assign(node: "Node", root: List["Node"]):
-        if not assigned[node]:
-            assigned[node] = True
-            root.append(node)
-            for father in node.fathers:
-                assign(father, root)
+        if assigned[node]:
+            return
+        assigned[node] = True
+        root.append(node)
+        stack = [iter(node.fathers)]
+        while stack:
+            for father in stack[-1]:
+                if not assigned[father]:
+                    assigned[father] = True
+                    root.append(father)
+                    stack.append(iter(father.fathers))
+                    break
+            else:
+                stack.pop()
 
     for n in l:
         component: List["Node"] = []
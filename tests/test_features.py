@@ -1,13 +1,23 @@
 import inspect
+import logging
+
+import pytest
 
 from crytic_compile import CryticCompile
 from crytic_compile.platform.solc_standard_json import SolcStandardJson
+from crytic_compile.utils.zip import load_from_zip
 from solc_select import solc_select
 
 from slither import Slither
 from slither.core.variables.state_variable import StateVariable
 from slither.detectors import all_detectors
 from slither.detectors.abstract_detector import AbstractDetector
+from slither.detectors.variables.could_be_constant import CouldBeConstant
+from slither.detectors.variables.could_be_immutable import CouldBeImmutable
+from slither.detectors.variables.unchanged_state_variables import UnchangedStateVariables
+from slither.detectors.variables.uninitialized_state_variables import (
+    UninitializedStateVarsDetection,
+)
 from slither.slithir.operations import LibraryCall, InternalCall
 
 
@@ -150,3 +160,70 @@ def test_private_variable() -> None:
     var_read = f.variables_read[0]
     assert isinstance(var_read, StateVariable)
     assert str(var_read.contract) == "B"
+
+
+def test_uninitialized_state_proxy_scan_memoized(monkeypatch) -> None:
+    slither = Slither(
+        load_from_zip("./tests/ast-parsing/compile/contract-0.6.0.sol-0.8.0-compact.zip")[0]
+    )
+    compilation_unit = slither.compilation_units[0]
+    proxy, *contracts = compilation_unit.contracts
+    proxy.is_upgradeable_proxy = True
+    for contract in contracts:
+        contract.is_upgradeable_proxy = False
+        contract.is_upgradeable = True
+
+    proxy_scans = []
+    written_variables = UninitializedStateVarsDetection._written_variables
+
+    def _written_variables(contract):
+        if contract == proxy:
+            proxy_scans.append(contract)
+        return written_variables(contract)
+
+    monkeypatch.setattr(
+        UninitializedStateVarsDetection, "_written_variables", staticmethod(_written_variables)
+    )
+
+    detector = UninitializedStateVarsDetection(
+        compilation_unit, slither, logging.getLogger("Detectors")
+    )
+    for contract in contracts:
+        detector._written_variables_in_proxy(contract)  # pylint: disable=protected-access
+    detector.detect()
+
+    # The variables written in the proxies are collected once per detector, not per contract
+    assert len(proxy_scans) == 1
+
+
+@pytest.mark.parametrize(
+    "zip_file",
+    [
+        "./tests/ast-parsing/compile/variable-0.8.0.sol-0.8.0-compact.zip",
+        "./tests/ast-parsing/compile/minmax-0.6.8.sol-0.8.0-compact.zip",
+    ],
+)
+def test_unchanged_state_variables_shared(zip_file: str, monkeypatch) -> None:
+    analyses = []
+    detect = UnchangedStateVariables.detect
+
+    def _detect(self):
+        analyses.append(self.compilation_unit)
+        detect(self)
+
+    monkeypatch.setattr(UnchangedStateVariables, "detect", _detect)
+
+    def _run(detectors):
+        slither = Slither(load_from_zip(zip_file)[0])
+        for detector in detectors:
+            slither.register_detector(detector)
+        return [[r["description"] for r in results] for results in slither.run_detectors()]
+
+    alone = _run([CouldBeConstant]) + _run([CouldBeImmutable])
+    analyses.clear()
+    together = _run([CouldBeConstant, CouldBeImmutable])
+
+    # Both detectors use the same analysis, and report the same results as when run alone
+    assert len(analyses) == 1
+    assert together == alone
+    assert any(alone)